@@ -1,12 +1,13 @@
 """Store client to interact with Schema Registry HTTP API."""
 
-import json
+import asyncio
+import functools
 import logging
 import os
 import ssl
+import types
 import typing
 from abc import abstractmethod
-from collections import defaultdict
 from urllib.parse import urlparse
 
 import certifi
@@ -23,6 +24,9 @@ from .urls import UrlManager
 
 logger = logging.getLogger(__name__)
 
+# read-only stand in for the cache of a subject that has nothing cached yet
+_EMPTY_CACHE: typing.Mapping = types.MappingProxyType({})
+
 
 def get_response_and_status_code(
     response: httpx.Response,
@@ -90,17 +94,36 @@ class BaseClient:
         self.client_kwargs = self._get_client_kwargs()
 
         # Cache Schemas: subj => { schema => id }
-        self.subject_to_schema_ids: typing.Dict[str, typing.Dict[str, int]] = defaultdict(dict)
+        self.subject_to_schema_ids: typing.Dict[str, typing.Dict[BaseSchema, int]] = {}
 
         # Cache Schemas: subj => { schema => version }
-        self.subject_to_schema_versions: typing.Dict[str, typing.Dict[str, typing.Union[str, int]]] = defaultdict(dict)
+        self.subject_to_schema_versions: typing.Dict[str, typing.Dict[BaseSchema, typing.Union[str, int]]] = {}
 
         # Cache Schemas: id => avro_schema
         self.id_to_schema: typing.Dict[int, BaseSchema] = {}
 
+        # Requests in flight: id => schema being fetched (async client)
+        self._pending_schemas: typing.Dict[int, asyncio.Future] = {}
+
+        # httpx client shared by all the requests, created on first use
+        self._session: typing.Any = None
+
+        # Event loop of the async session and the generator closing it when the loop shuts down (async client)
+        self._session_loop: typing.Optional[asyncio.AbstractEventLoop] = None
+        self._session_closer: typing.Optional[typing.AsyncGenerator] = None
+
     def __eq__(self, obj: typing.Any) -> bool:
         return self.conf == obj.conf and self.extra_headers == obj.extra_headers
 
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        # open connections and requests in flight can not be pickled
+        state = self.__dict__.copy()
+        state["_session"] = None
+        state["_session_loop"] = None
+        state["_session_closer"] = None
+        state["_pending_schemas"] = {}
+        return state
+
     @staticmethod
     def _schema_from_result(result: typing.Dict) -> BaseSchema:
         schema: str = result["schema"]
@@ -214,12 +237,12 @@ class BaseClient:
         return _headers
 
     def _cache_subject_to_schema_ids(self, subject: str, schema: BaseSchema, value: int) -> None:
-        self.subject_to_schema_ids[subject][str(schema)] = value
+        self.subject_to_schema_ids.setdefault(subject, {})[schema] = value
 
     def _cache_subject_to_schema_versions(
         self, subject: str, schema: BaseSchema, value: typing.Union[str, int]
     ) -> None:
-        self.subject_to_schema_versions[subject][str(schema)] = value
+        self.subject_to_schema_versions.setdefault(subject, {})[schema] = value
 
     def _cache_schema(
         self,
@@ -228,10 +251,8 @@ class BaseClient:
         subject: typing.Optional[str] = None,
         version: typing.Union[str, int, None] = None,
     ) -> None:
-        if schema_id in self.id_to_schema:
-            schema = self.id_to_schema[schema_id]
-        else:
-            self.id_to_schema[schema_id] = schema
+        # keep the instance already cached for this id, so every caller shares it
+        schema = self.id_to_schema.setdefault(schema_id, schema)
 
         if subject:
             self._cache_subject_to_schema_ids(subject, schema, schema_id)
@@ -304,9 +325,30 @@ class SchemaRegistryClient(BaseClient):
             raise ClientError(f"Method {method} is invalid; valid methods include {utils.VALID_METHODS}")
 
         _headers = self.prepare_headers(body=body, headers=headers)
-        with httpx.Client(**self.client_kwargs) as client:
-            response = client.request(method, url, headers=_headers, json=body, params=params, timeout=timeout)
-        return response
+        return self.session.request(method, url, headers=_headers, json=body, params=params, timeout=timeout)
+
+    @property
+    def session(self) -> httpx.Client:
+        """The `httpx.Client` used to send the requests.
+
+        It is created on first use and kept open, so the connections are reused between requests.
+        Call `close` when the client is not needed anymore, or use the client as a context manager.
+        """
+        if self._session is None:
+            self._session = httpx.Client(**self.client_kwargs)
+        return self._session
+
+    def close(self) -> None:
+        """Close the underlying http connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self) -> "SchemaRegistryClient":
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
 
     def register(
         self,
@@ -322,7 +364,7 @@ class SchemaRegistryClient(BaseClient):
         If schema is a string, the `schema_type` kwarg must be used to indicate
         what type of schema the string is (`AVRO` by default).
         If the schema is already parsed, the schema_type is inferred directly from the parsed schema.
-        Multiple instances of the same schema will result in cache misses.
+        Equal instances of the same schema share the same cache entry.
 
         Args:
             subject: subject name
@@ -337,7 +379,7 @@ class SchemaRegistryClient(BaseClient):
         if isinstance(schema, str) or isinstance(schema, dict):
             schema = SchemaFactory.create_schema(schema, schema_type)
 
-        schema_id = self.subject_to_schema_ids[subject].get(str(schema))
+        schema_id = self.subject_to_schema_ids.get(subject, _EMPTY_CACHE).get(schema)
         if schema_id is not None:
             return schema_id
 
@@ -352,7 +394,7 @@ class SchemaRegistryClient(BaseClient):
 
         url, method = self.url_manager.url_for("register", subject=subject)
         body = {
-            "schema": json.dumps(schema.raw_schema),
+            "schema": schema.raw_schema_str,
             "schemaType": schema.schema_type,
         }
 
@@ -451,8 +493,9 @@ class SchemaRegistryClient(BaseClient):
         Returns:
             Avro or JSON schema
         """
-        if schema_id in self.id_to_schema:
-            return self.id_to_schema[schema_id]
+        schema = self.id_to_schema.get(schema_id)
+        if schema is not None:
+            return schema
 
         url, method = self.url_manager.url_for("get_by_id", schema_id=schema_id)
 
@@ -540,9 +583,8 @@ class SchemaRegistryClient(BaseClient):
             return None
 
         schema_id = result.get("id")
-        if schema_id in self.id_to_schema:
-            schema = self.id_to_schema[schema_id]
-        else:
+        schema = self.id_to_schema.get(schema_id)
+        if schema is None:
             schema = self._schema_from_result(result)
 
         version = result["version"]
@@ -649,15 +691,15 @@ class SchemaRegistryClient(BaseClient):
         if isinstance(schema, str) or isinstance(schema, dict):
             schema = SchemaFactory.create_schema(schema, schema_type)
 
-        version = self.subject_to_schema_versions[subject].get(str(schema))
-        schema_id = self.subject_to_schema_ids[subject].get(str(schema))
+        version = self.subject_to_schema_versions.get(subject, _EMPTY_CACHE).get(schema)
+        schema_id = self.subject_to_schema_ids.get(subject, _EMPTY_CACHE).get(schema)
 
         if all((version, schema_id)):
             return utils.SchemaVersion(subject=subject, schema_id=schema_id, version=version, schema=schema)
 
         url, method = self.url_manager.url_for("check_version", subject=subject)
         body = {
-            "schema": json.dumps(schema.raw_schema),
+            "schema": schema.raw_schema_str,
             "schemaType": schema.schema_type,
         }
         result, code = get_response_and_status_code(
@@ -714,7 +756,7 @@ class SchemaRegistryClient(BaseClient):
             schema = SchemaFactory.create_schema(schema, schema_type)
 
         body = {
-            "schema": json.dumps(schema.raw_schema),
+            "schema": schema.raw_schema_str,
             "schemaType": schema.schema_type,
         }
         result, code = get_response_and_status_code(
@@ -850,10 +892,59 @@ class AsyncSchemaRegistryClient(BaseClient):
             raise ClientError(f"Method {method} is invalid; valid methods include {utils.VALID_METHODS}")
 
         _headers = self.prepare_headers(body=body, headers=headers)
-        async with httpx.AsyncClient(**self.client_kwargs) as client:
-            response = await client.request(method, url, headers=_headers, json=body, params=params, timeout=timeout)
+        session = self.session
+        if self._session_closer is None:
+            # The loop closes its async generators still alive in `shutdown_asyncgens`, before closing itself,
+            # so the session is closed while its connections can still be shut down.
+            self._session_closer = self._close_session_on_shutdown(session)
+            await self._session_closer.asend(None)
+
+        return await session.request(method, url, headers=_headers, json=body, params=params, timeout=timeout)
+
+    @property
+    def session(self) -> httpx.AsyncClient:
+        """The `httpx.AsyncClient` used to send the requests.
+
+        It is created on first use and kept open, so the connections are reused between requests.
+        Its connections belong to the event loop it was created in: the session is closed when that loop shuts
+        down (`asyncio.run` does it when it finishes), and a new one is created when the client is used from
+        another event loop.
+        """
+        try:
+            loop: typing.Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
 
-        return response
+        if self._session is None or (loop is not None and loop is not self._session_loop):
+            self._session = httpx.AsyncClient(**self.client_kwargs)
+            self._session_loop = loop
+            self._session_closer = None
+        return self._session
+
+    @staticmethod
+    async def _close_session_on_shutdown(session: httpx.AsyncClient) -> typing.AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            await session.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying http connections."""
+        if self._session_closer is not None:
+            # closing the generator closes the session
+            await self._session_closer.aclose()
+            self._session_closer = None
+
+        if self._session is not None:
+            await self._session.aclose()
+            self._session = None
+            self._session_loop = None
+
+    async def __aenter__(self) -> "AsyncSchemaRegistryClient":
+        return self
+
+    async def __aexit__(self, *args: typing.Any) -> None:
+        await self.aclose()
 
     async def register(
         self,
@@ -869,7 +960,7 @@ class AsyncSchemaRegistryClient(BaseClient):
         If schema is a string, the `schema_type` kwarg must be used to indicate what type of schema the string is
         ("AVRO" by default).
         If the schema is already parsed, the schema_type is inferred directly from the parsed schema.
-        Multiple instances of the same schema will result in cache misses.
+        Equal instances of the same schema share the same cache entry.
 
         POST /subjects/(string: subject)/versions
 
@@ -886,7 +977,7 @@ class AsyncSchemaRegistryClient(BaseClient):
         if isinstance(schema, str) or isinstance(schema, dict):
             schema = SchemaFactory.create_schema(schema, schema_type)
 
-        schema_id = self.subject_to_schema_ids[subject].get(str(schema))
+        schema_id = self.subject_to_schema_ids.get(subject, _EMPTY_CACHE).get(schema)
         if schema_id is not None:
             return schema_id
 
@@ -902,7 +993,7 @@ class AsyncSchemaRegistryClient(BaseClient):
 
         url, method = self.url_manager.url_for("register", subject=subject)
         body = {
-            "schema": json.dumps(schema.raw_schema),
+            "schema": schema.raw_schema_str,
             "schemaType": schema.schema_type,
         }
 
@@ -995,6 +1086,10 @@ class AsyncSchemaRegistryClient(BaseClient):
     ) -> typing.Optional[BaseSchema]:
         """Retrieve a parsed avro schema by id or None if not found.
 
+        Coroutines asking for the same schema id at the same time share a single request. The request is only
+        shared by calls without extra headers and with the client default timeout, a call passing either of them
+        sends its own request.
+
         GET /schemas/ids/{int: id}
 
         Args:
@@ -1005,9 +1100,33 @@ class AsyncSchemaRegistryClient(BaseClient):
         Returns:
             Avro or JSON schema
         """
-        if schema_id in self.id_to_schema:
-            return self.id_to_schema[schema_id]
+        schema = self.id_to_schema.get(schema_id)
+        if schema is not None:
+            return schema
+
+        if headers is not None or timeout is not USE_CLIENT_DEFAULT:
+            return await self._fetch_schema_by_id(schema_id, headers=headers, timeout=timeout)
+
+        pending = self._pending_schemas.get(schema_id)
+        # a request left pending by another event loop can not be awaited from this one
+        if pending is None or pending.get_loop() is not asyncio.get_running_loop():
+            pending = asyncio.ensure_future(self._fetch_schema_by_id(schema_id))
+            self._pending_schemas[schema_id] = pending
+            pending.add_done_callback(functools.partial(self._forget_pending_schema, schema_id))
+
+        # shield the shared request so a cancelled caller does not cancel it for the others
+        return await asyncio.shield(pending)
+
+    def _forget_pending_schema(self, schema_id: int, pending: asyncio.Future) -> None:
+        if self._pending_schemas.get(schema_id) is pending:
+            del self._pending_schemas[schema_id]
 
+    async def _fetch_schema_by_id(
+        self,
+        schema_id: int,
+        headers: typing.Optional[typing.Dict] = None,
+        timeout: typing.Union[TimeoutTypes, UseClientDefault] = USE_CLIENT_DEFAULT,
+    ) -> typing.Optional[BaseSchema]:
         url, method = self.url_manager.url_for("get_by_id", schema_id=schema_id)
 
         result, code = get_response_and_status_code(
@@ -1069,9 +1188,8 @@ class AsyncSchemaRegistryClient(BaseClient):
             return None
 
         schema_id = result.get("id")
-        if schema_id in self.id_to_schema:
-            schema = self.id_to_schema[schema_id]
-        else:
+        schema = self.id_to_schema.get(schema_id)
+        if schema is None:
             schema = self._schema_from_result(result)
 
         version = result["version"]
@@ -1218,22 +1336,18 @@ class AsyncSchemaRegistryClient(BaseClient):
         Returns:
             SchemaVersion If schema exist
         """
-        schemas_to_version = self.subject_to_schema_versions[subject]
-
         if isinstance(schema, str) or isinstance(schema, dict):
             schema = SchemaFactory.create_schema(schema, schema_type)
 
-        version = schemas_to_version.get(str(schema))
-
-        schemas_to_id = self.subject_to_schema_ids[subject]
-        schema_id = schemas_to_id.get(str(schema))
+        version = self.subject_to_schema_versions.get(subject, _EMPTY_CACHE).get(schema)
+        schema_id = self.subject_to_schema_ids.get(subject, _EMPTY_CACHE).get(schema)
 
         if all((version, schema_id)):
             return utils.SchemaVersion(subject=subject, schema_id=schema_id, version=version, schema=schema)
 
         url, method = self.url_manager.url_for("check_version", subject=subject)
         body = {
-            "schema": json.dumps(schema.raw_schema),
+            "schema": schema.raw_schema_str,
             "schemaType": schema.schema_type,
         }
 
@@ -1292,7 +1406,7 @@ class AsyncSchemaRegistryClient(BaseClient):
             schema = SchemaFactory.create_schema(schema, schema_type)
 
         body = {
-            "schema": json.dumps(schema.raw_schema),
+            "schema": schema.raw_schema_str,
             "schemaType": schema.schema_type,
         }
         result, code = get_response_and_status_code(
@@ -2,18 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import typing
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
-import aiofiles
 import fastavro
 import jsonschema
 
 from schema_registry.client.utils import AVRO_SCHEMA_TYPE, JSON_SCHEMA_TYPE
 
 
+def _read_file(fp: str) -> str:
+    with open(fp, mode="r") as f:
+        return f.read()
+
+
+async def _async_read_file(fp: str) -> str:
+    # a single round trip to the executor instead of one per file operation
+    return await asyncio.get_running_loop().run_in_executor(None, _read_file, fp)
+
+
 class BaseSchema(ABC):
     """Abstract class for schema wrapper"""
 
@@ -22,6 +32,7 @@ class BaseSchema(ABC):
             schema = json.loads(schema)
         self.raw_schema = typing.cast(typing.Dict, schema)
         self.schema = self.parse_schema(self.raw_schema)
+        self._raw_schema_str: typing.Optional[str] = None
         self.generate_hash()
 
     @abstractmethod
@@ -48,6 +59,17 @@ class BaseSchema(ABC):
     def schema_type(self) -> str:
         pass
 
+    @property
+    def raw_schema_str(self) -> str:
+        """Returns the raw schema serialized as JSON, as sent to the schema registry.
+
+        Returns:
+            raw_schema_str (str): JSON string of the raw schema, serialized only once
+        """
+        if self._raw_schema_str is None:
+            self._raw_schema_str = json.dumps(self.raw_schema)
+        return self._raw_schema_str
+
     def generate_hash(self) -> None:
         self._hash = hash(json.dumps(self.schema))
 
@@ -115,21 +137,23 @@ class AvroSchema(BaseSchema):
     @staticmethod
     def load(fp: str) -> AvroSchema:
         """Parse an avro schema from a file path."""
-        with open(fp, mode="r") as f:
-            content = f.read()
-            return AvroSchema(content)
+        return AvroSchema(_read_file(fp))
 
     @staticmethod
     async def async_load(fp: str) -> AvroSchema:
         """Parse an avro schema from a file path."""
-        async with aiofiles.open(fp, mode="r") as f:
-            content = await f.read()
-            return AvroSchema(content)
+        content = await _async_read_file(fp)
+        return AvroSchema(content)
 
 
 class JsonSchema(BaseSchema):
     """Integrate BaseSchema for JSON schema."""
 
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self._validator: typing.Optional[jsonschema.protocols.Validator] = None
+
+        super().__init__(*args, **kwargs)
+
     @property
     def name(self) -> typing.Optional[str]:
         return self.schema.get("title", self.schema.get("$id", self.schema.get("$ref")))
@@ -138,6 +162,20 @@ class JsonSchema(BaseSchema):
     def schema_type(self) -> str:
         return JSON_SCHEMA_TYPE
 
+    @property
+    def validator(self) -> jsonschema.protocols.Validator:
+        """Returns a validator for the schema, created once and shared by everyone using this schema.
+
+        Returns:
+            validator (jsonschema.protocols.Validator): Validator of the draft declared by the schema
+        """
+        if self._validator is None:
+            validator_class = jsonschema.validators.validator_for(self.schema)
+            validator_class.check_schema(self.schema)
+            self._validator = validator_class(self.schema)
+
+        return self._validator
+
     def parse_schema(self, schema: typing.Dict) -> typing.Dict:
         jsonschema.Draft7Validator.check_schema(schema)
         return schema
@@ -145,16 +183,13 @@ class JsonSchema(BaseSchema):
     @staticmethod
     def load(fp: str) -> BaseSchema:
         """Parse a json schema from a file path."""
-        with open(fp, mode="r") as f:
-            content = f.read()
-            return JsonSchema(content)
+        return JsonSchema(_read_file(fp))
 
     @staticmethod
     async def async_load(fp: str) -> BaseSchema:
         """Parse a json schema from a file path."""
-        async with aiofiles.open(fp, mode="r") as f:
-            content = await f.read()
-            return JsonSchema(content)
+        content = await _async_read_file(fp)
+        return JsonSchema(content)
 
 
 class SchemaFactory:
@@ -33,9 +33,10 @@ class UrlManager:
     def url_for(self, func: str, **kwargs: typing.Any) -> tuple:
         """Generate a url for a given function."""
         path = self.paths[func]
-        url = path.generate_url(**kwargs)
 
-        return urllib.parse.urljoin(self.base_url, url), path.method
+        # paths are relative and base_url always ends with /, so a plain
+        # concatenation is enough (and cheaper than urljoin)
+        return self.base_url + path.generate_url(**kwargs), path.method
 
 
 class Path:
@@ -13,6 +13,7 @@ from schema_registry.serializers import (
 
 try:
     from faust import Codec, Record
+    from faust.types.codecs import CodecT
 except ImportError as ex:
     raise Exception("Cannot use Faust serializers Faust is not installed.") from ex
 
@@ -25,12 +26,48 @@ class Serializer(Codec):
         schema_subject: str,
         schema: BaseSchema,
         message_serializer: MessageSerializer,
+        children: typing.Optional[typing.Tuple[CodecT, ...]] = None,
     ):
         self.schema_subject = schema_subject
         self.schema = schema
         self.message_serializer = message_serializer
 
-        Codec.__init__(self)
+        # id of `schema`, known once the schema has been registered by `_dumps`
+        self._schema_id: typing.Optional[int] = None
+
+        # the arguments are kept as kwargs, so `Codec.clone` can chain codecs after the serializer
+        Codec.__init__(
+            self,
+            children=children or (),
+            schema_subject=schema_subject,
+            schema=schema,
+            message_serializer=message_serializer,
+        )
+
+    def dumps_many(self, objs: typing.Iterable[typing.Dict[str, typing.Any]]) -> typing.List[bytes]:
+        """Encode a batch of records, the same as calling `dumps` for each one of them.
+
+        The schema id, writer and header are shared between all the records,
+        then the codecs chained after the serializer (`serializer | binary`) encode each message.
+        """
+        messages = self._dumps_many(objs)
+        for node in self.children:
+            _dumps = typing.cast(Codec, node)._dumps
+            messages = [_dumps(message) for message in messages]
+        return messages
+
+    def loads_many(
+        self, messages: typing.Iterable[typing.Optional[bytes]]
+    ) -> typing.List[typing.Optional[typing.Dict]]:
+        """Decode a batch of messages, the same as calling `loads` for each one of them.
+
+        The chained codecs decode each message in reverse order first, then the writer schema of each
+        schema id is looked up only once. `None` messages are decoded as `None`.
+        """
+        for node in reversed(self.children):
+            _loads = typing.cast(Codec, node)._loads
+            messages = [None if message is None else _loads(message) for message in messages]
+        return self._loads_many(messages)
 
     def _loads(self, event: bytes) -> typing.Optional[typing.Dict]:
         return self.message_serializer.decode_message(event)
@@ -43,19 +80,56 @@ class Serializer(Codec):
         """
         payload = self.clean_payload(payload)
 
-        return self.message_serializer.encode_record_with_schema(self.schema_subject, self.schema, payload)
+        return self.message_serializer.encode_record_with_schema_id(self._get_schema_id(), payload)
+
+    def _loads_many(self, events: typing.Iterable[typing.Optional[bytes]]) -> typing.List[typing.Optional[typing.Dict]]:
+        """Decode a batch of events, looking up the writer schema of each schema id only once."""
+        return self.message_serializer.decode_messages(events)
+
+    def _dumps_many(self, payloads: typing.Iterable[typing.Dict[str, typing.Any]]) -> typing.List[bytes]:
+        """Encode a batch of records, sharing the schema id, writer and header between all of them."""
+        clean_payload = self.clean_payload
+        return self.message_serializer.encode_records_with_schema_id(
+            self._get_schema_id(), (clean_payload(p) for p in payloads)
+        )
+
+    def _get_schema_id(self) -> int:
+        # subject and schema never change, so the schema is registered only for the first message
+        schema_id = self._schema_id
+        if schema_id is None:
+            schema_id = self._schema_id = self.message_serializer.register_schema(self.schema_subject, self.schema)
+        return schema_id
 
     @staticmethod
-    def _clean_item(item: typing.Any) -> typing.Any:
-        if isinstance(item, Record):
+    def _clean_item(
+        item: typing.Any,
+        _Record: type = Record,
+        _Mapping: type = Mapping,
+        _Sequence: type = Sequence,
+        _str: type = str,
+        _isinstance: typing.Callable = isinstance,
+    ) -> typing.Any:
+        # The keyword defaults bind the globals used on every item as locals, which are cheaper to load.
+        item_type = item.__class__
+        # Payloads are mostly made of plain containers, build them directly before the generic checks.
+        if item_type is dict:
+            return {key: Serializer._clean_item(value) for key, value in item.items()}
+        elif item_type is list:
+            return [Serializer._clean_item(value) for value in item]
+        elif item_type is tuple:
+            return tuple([Serializer._clean_item(value) for value in item])
+        elif item_type is _str:
+            return item
+
+        if _isinstance(item, _Record):
             return Serializer._clean_item(item.to_representation())
-        elif isinstance(item, str):
+        elif _isinstance(item, _str):
             # str is also a sequence, need to make sure we don't iterate over it.
             return item
-        elif isinstance(item, Mapping):
-            return type(item)({key: Serializer._clean_item(value) for key, value in item.items()})  # type: ignore
-        elif isinstance(item, Sequence):
-            return type(item)(Serializer._clean_item(value) for value in item)  # type: ignore
+        elif _isinstance(item, _Mapping):
+            return item_type({key: Serializer._clean_item(value) for key, value in item.items()})
+        elif _isinstance(item, _Sequence):
+            return item_type(Serializer._clean_item(value) for value in item)
         return item
 
     @staticmethod
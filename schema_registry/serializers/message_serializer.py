@@ -1,17 +1,17 @@
 """Defines serializer for serlizing and deserializing messages"""
 
+import asyncio
+import functools
 import io
 import json
 import logging
 import struct
-import sys
-import traceback
 import typing
 from abc import ABC, abstractmethod
 
 from fastavro import schemaless_reader, schemaless_writer
-from fastavro.types import Schema
-from jsonschema import validate
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 from schema_registry.client import (
     AsyncSchemaRegistryClient,
@@ -20,14 +20,31 @@ from schema_registry.client import (
     utils,
 )
 from schema_registry.client.errors import ClientError
-from schema_registry.client.schema import BaseSchema
+from schema_registry.client.schema import BaseSchema, JsonSchema
 
 from .errors import SerializerError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 log = logging.getLogger(__name__)
 
 MAGIC_BYTE = 0
 
+# Default maximum number of writers/decoders cached by a serializer
+DEFAULT_CACHE_SIZE = 1024
+
+# Magic byte and schema ID in network byte order (big endian)
+_HEADER_STRUCT = struct.Struct(">bI")
+
+
+@functools.lru_cache(maxsize=DEFAULT_CACHE_SIZE)
+def _pack_header(schema_id: int) -> bytes:
+    """Magic byte and schema ID of a message, packed once per schema ID."""
+    return _HEADER_STRUCT.pack(MAGIC_BYTE, schema_id)
+
 
 class ContextStringIO(io.BytesIO):
     """Wrapper to allow use of StringIO via 'with' constructs."""
@@ -39,36 +56,290 @@ class ContextStringIO(io.BytesIO):
         self.close()
 
 
-class MessageSerializer(ABC):
-    """A helper class that can serialize and deserialize messages asynchronously.
+def _json_dumps(obj: typing.Any) -> bytes:
+    return json.dumps(obj).encode()
 
-    Args:
-        schemaregistry_client: Http Client
-        reader_schema: Specify a schema to decode the message
-        return_record_name: If the record name should be returned
+
+def _orjson_dumps(obj: typing.Any) -> bytes:
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # orjson can not encode everything json can, for example integers over 64 bits
+        return _json_dumps(obj)
+
+
+def _get_json_validate_func(schema: BaseSchema) -> typing.Callable[[typing.Any], None]:
+    """Build a function validating instances against a JSON schema.
+
+    `jsonschema.validate` checks the schema and creates a new validator on every call,
+    here the validator of the schema is reused and the same errors as `jsonschema.validate` are raised.
+    """
+    if isinstance(schema, JsonSchema):
+        validator = schema.validator
+    else:
+        # not a JSON schema (for example an id pointing to an Avro schema), checked like `jsonschema.validate` does
+        validator_class = validator_for(schema.schema)
+        validator_class.check_schema(schema.schema)
+        validator = validator_class(schema.schema)
+
+    iter_errors = validator.iter_errors
+
+    def validate(instance: typing.Any) -> None:
+        error = best_match(iter_errors(instance))
+        if error is not None:
+            raise error
+
+    return validate
+
+
+class _BoundedCache(dict):
+    """Dictionary keeping up to `maxsize` items, the oldest item is evicted first.
+
+    Only inserts are bounded, so lookups stay on the plain `dict.get`.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __setitem__(self, key: typing.Any, value: typing.Any) -> None:
+        if len(self) >= self.maxsize and key not in self:
+            try:
+                # dicts keep the insertion order, the first key is the oldest one
+                del self[next(iter(self))]
+            except (KeyError, RuntimeError, StopIteration):
+                # changed by another thread in the meantime
+                pass
+        super().__setitem__(key, value)
+
+    def __reduce__(self) -> typing.Tuple:
+        return self.__class__, (self.maxsize,), None, None, iter(self.items())
+
+    def copy(self) -> "_BoundedCache":
+        cache = self.__class__(self.maxsize)
+        cache.update(self)
+        return cache
+
+
+class _BytearrayWriter:
+    """Minimal writable file object appending everything written to a bytearray.
+
+    Encoders only call `write`, so a record can be appended to a buffer owned by the caller
+    without going through an intermediate buffer.
+    """
+
+    __slots__ = ("write",)
+
+    def __init__(self, buffer: bytearray) -> None:
+        self.write = buffer.extend
+
+
+class _BaseMessageSerializer(ABC):
+    """Logic shared by the sync and async serializers.
+
+    Only the calls to the schema registry differ between them, so everything else
+    (header handling and the writers/decoders caches) lives here.
     """
 
     def __init__(
         self,
-        schemaregistry_client: SchemaRegistryClient,
+        schemaregistry_client: typing.Union[SchemaRegistryClient, AsyncSchemaRegistryClient],
         reader_schema: typing.Optional[schema.AvroSchema] = None,
         return_record_name: bool = False,
+        cache_size: int = DEFAULT_CACHE_SIZE,
     ):
         self.schemaregistry_client = schemaregistry_client
-        self.id_to_decoder_func = {}  # type: typing.Dict
-        self.id_to_writers = {}  # type: typing.Dict
+        self.id_to_decoder_func = _BoundedCache(cache_size)
+        self.id_to_writers = _BoundedCache(cache_size)
         self.reader_schema = reader_schema
         self.return_record_name = return_record_name
 
-    @property
-    @abstractmethod
-    def _serializer_schema_type(self) -> typing.Literal["AVRO", "JSON"]: ...
+    # Set by the Avro/Json subclasses as a plain class attribute, reading it does not go through a descriptor
+    _serializer_schema_type: typing.ClassVar[typing.Literal["AVRO", "JSON"]]
 
     @abstractmethod
     def _get_encoder_func(self, schema: BaseSchema) -> typing.Callable: ...
 
     @abstractmethod
-    def _get_decoder_func(self, payload: ContextStringIO, writer_schema: BaseSchema) -> typing.Callable: ...
+    def _get_decoder_func(
+        self, payload: typing.Optional[ContextStringIO], writer_schema: BaseSchema
+    ) -> typing.Callable: ...
+
+    def _ensure_writer(self, schema_id: int, schema: BaseSchema) -> typing.Callable:
+        writer = self.id_to_writers.get(schema_id)
+        if writer is None:
+            self.id_to_writers[schema_id] = writer = self._get_encoder_func(schema)
+        return writer
+
+    def _cache_writer(self, schema_id: int, schema: typing.Optional[BaseSchema]) -> typing.Callable:
+        if not schema:
+            raise SerializerError("Schema does not exist")
+
+        self.id_to_writers[schema_id] = writer = self._get_encoder_func(schema)
+        return writer
+
+    def _cache_registered_schema(self, schema_id: int, schema: BaseSchema) -> None:
+        self._ensure_writer(schema_id, schema)
+        if schema_id not in self.id_to_decoder_func:
+            self._cache_decoder(schema_id, schema)
+
+    def _cache_decoder(self, schema_id: int, writer_schema: typing.Optional[BaseSchema]) -> typing.Callable:
+        if writer_schema is None:
+            raise SerializerError(f"unable to fetch schema with id {schema_id}")
+
+        self.id_to_decoder_func[schema_id] = decoder_func = self._get_decoder_func(None, writer_schema)
+        return decoder_func
+
+    @staticmethod
+    def _pack_message(schema_id: int, writer: typing.Callable, record: dict) -> bytes:
+        buffer = io.BytesIO()
+        # Write the magic byte and schema ID in network byte order (big endian)
+        buffer.write(_pack_header(schema_id))
+
+        # write the record to the rest of the buffer
+        writer(record, buffer)
+
+        return buffer.getvalue()
+
+    @staticmethod
+    def _pack_messages(schema_id: int, writer: typing.Callable, records: typing.Iterable[dict]) -> typing.List[bytes]:
+        # the header is the same for every record of the batch
+        header = _pack_header(schema_id)
+        messages = []
+
+        for record in records:
+            buffer = io.BytesIO()
+            buffer.write(header)
+            writer(record, buffer)
+            messages.append(buffer.getvalue())
+
+        return messages
+
+    @staticmethod
+    def _pack_message_into(schema_id: int, writer: typing.Callable, record: dict, out: bytearray) -> int:
+        start = len(out)
+        out.extend(_pack_header(schema_id))
+        try:
+            writer(record, _BytearrayWriter(out))
+        except BaseException:
+            # leave the buffer as it was, without a partial message
+            del out[start:]
+            raise
+
+        return len(out) - start
+
+    @staticmethod
+    def _unpack_message(message: bytes) -> typing.Tuple[int, io.BytesIO]:
+        if len(message) <= 5:
+            raise SerializerError("message is too small to decode")
+
+        magic, schema_id = _HEADER_STRUCT.unpack_from(message, 0)
+        if magic != MAGIC_BYTE:
+            raise SerializerError("message does not start with magic byte")
+
+        # BytesIO shares the memory of the bytes object, so skipping the header does not copy the payload
+        payload = io.BytesIO(message)
+        payload.seek(_HEADER_STRUCT.size)
+
+        return schema_id, payload
+
+
+class _AvroSerializerMixin(_BaseMessageSerializer):
+    _serializer_schema_type = utils.AVRO_SCHEMA_TYPE
+
+    def _get_encoder_func(self, schema: typing.Union[BaseSchema]) -> typing.Callable:
+        # AvroSchema.schema is already parsed by fastavro, so it is not parsed again on every record.
+        # The writer and the schema are bound as defaults so each call only reads fast locals.
+        def avro_encoder_func(
+            record: dict,
+            fp: typing.IO,
+            _schemaless_writer: typing.Callable = schemaless_writer,
+            _parsed_schema: typing.Any = schema.schema,
+        ) -> None:
+            _schemaless_writer(fp, _parsed_schema, record)
+
+        return avro_encoder_func
+
+    def _get_decoder_func(
+        self, payload: typing.Optional[ContextStringIO], writer_schema: BaseSchema
+    ) -> typing.Callable:
+        # Resolve the (already parsed) reader schema once instead of on every record
+        parsed_writer_schema = writer_schema.schema
+        parsed_reader_schema = self.reader_schema.schema if self.reader_schema is not None else None
+        if parsed_reader_schema == parsed_writer_schema:
+            # No need for the reader schema if they are the same
+            parsed_reader_schema = None
+
+        # The reader and its arguments are bound as defaults and passed positionally, so no kwargs dict
+        # is built on every message.
+        def avro_decoder_func(
+            payload: typing.IO,
+            _schemaless_reader: typing.Callable = schemaless_reader,
+            _writer_schema: typing.Any = parsed_writer_schema,
+            _reader_schema: typing.Any = parsed_reader_schema,
+            _return_record_name: bool = self.return_record_name,
+        ) -> typing.Any:
+            return _schemaless_reader(payload, _writer_schema, _reader_schema, _return_record_name)
+
+        return avro_decoder_func
+
+
+class _JsonSerializerMixin(_BaseMessageSerializer):
+    _serializer_schema_type = utils.JSON_SCHEMA_TYPE
+
+    use_orjson = False
+
+    def _set_use_orjson(self, use_orjson: bool) -> None:
+        if use_orjson and orjson is None:
+            raise SerializerError(
+                "orjson is not installed, install it with `pip install python-schema-registry-client[orjson]`"
+            )
+        self.use_orjson = use_orjson
+
+    def _get_encoder_func(self, schema: typing.Union[BaseSchema]) -> typing.Callable:
+        validate = _get_json_validate_func(schema)
+        json_dumps = _orjson_dumps if self.use_orjson else _json_dumps
+
+        def json_encoder_func(record: dict, fp: typing.IO) -> typing.Any:
+            validate(record)
+            fp.write(json_dumps(record))
+
+        return json_encoder_func
+
+    def _get_decoder_func(
+        self, payload: typing.Optional[ContextStringIO], writer_schema: BaseSchema
+    ) -> typing.Callable:
+        validate = _get_json_validate_func(writer_schema)
+        json_loads = orjson.loads if self.use_orjson else json.loads
+
+        def json_decoder_func(payload: typing.IO) -> typing.Any:
+            obj = json_loads(payload.read())
+            validate(obj)
+            return obj
+
+        return json_decoder_func
+
+
+class MessageSerializer(_BaseMessageSerializer):
+    """A helper class that can serialize and deserialize messages asynchronously.
+
+    Args:
+        schemaregistry_client: Http Client
+        reader_schema: Specify a schema to decode the message
+        return_record_name: If the record name should be returned
+        cache_size: Maximum number of schema writers and decoders kept in memory
+    """
+
+    schemaregistry_client: SchemaRegistryClient
+
+    def __init__(
+        self,
+        schemaregistry_client: SchemaRegistryClient,
+        reader_schema: typing.Optional[schema.AvroSchema] = None,
+        return_record_name: bool = False,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        super().__init__(schemaregistry_client, reader_schema, return_record_name, cache_size)
 
     def encode_record_with_schema(
         self, subject: str, schema: BaseSchema, record: typing.Dict[str, typing.Any]
@@ -90,10 +361,35 @@ class MessageSerializer(ABC):
         schema_id = self.schemaregistry_client.register(subject, schema, schema_type=self._serializer_schema_type)
 
         # cache writer
-        if not self.id_to_writers.get(schema_id):
-            self.id_to_writers[schema_id] = self._get_encoder_func(schema)
+        writer = self._ensure_writer(schema_id, schema)
 
-        return self.encode_record_with_schema_id(schema_id, record)
+        return self._pack_message(schema_id, writer, record)
+
+    def register_schema(self, subject: str, schema: BaseSchema) -> int:
+        """Register a schema for the given subject, so records can be encoded with its schema ID.
+
+        The writer and the decoder of the schema are cached, messages encoded with it are decoded
+        without fetching the schema from the registry.
+
+        Args:
+            subject: Subject name
+            schema: Avro or JSON Schema
+
+        Returns:
+            Schema ID
+        """
+        schema_id = self.schemaregistry_client.register(subject, schema, schema_type=self._serializer_schema_type)
+        self._cache_registered_schema(schema_id, schema)
+
+        return schema_id
+
+    def _fetch_writer(self, schema_id: int) -> typing.Callable:
+        try:
+            schema = self.schemaregistry_client.get_by_id(schema_id)
+        except ClientError as e:
+            raise SerializerError(f"unable to fetch schema with id {schema_id}: {e}") from e
+
+        return self._cache_writer(schema_id, schema)
 
     def encode_record_with_schema_id(self, schema_id: int, record: dict) -> bytes:
         """Encode a record with a given schema id. The record must be a python dictionary.
@@ -105,26 +401,51 @@ class MessageSerializer(ABC):
         Returns:
             Decoder function
         """
-        # use slow avro
-        if schema_id not in self.id_to_writers:
-            try:
-                schema = self.schemaregistry_client.get_by_id(schema_id)
-                if not schema:
-                    raise SerializerError("Schema does not exist")
-                self.id_to_writers[schema_id] = self._get_encoder_func(schema)
-            except ClientError as err:
-                exc_type, exc_value, exc_traceback = sys.exc_info()
-                raise SerializerError(repr(traceback.format_exception(exc_type, exc_value, exc_traceback))) from err
+        writer = self.id_to_writers.get(schema_id)
+        if writer is None:
+            # use slow avro
+            writer = self._fetch_writer(schema_id)
 
-        writer = self.id_to_writers[schema_id]
-        with ContextStringIO() as outf:
-            # Write the magic byte and schema ID in network byte order (big endian)
-            outf.write(struct.pack(">bI", MAGIC_BYTE, schema_id))
+        return self._pack_message(schema_id, writer, record)
 
-            # write the record to the rest of the buffer
-            writer(record, outf)
+    def encode_record_with_schema_id_into(self, schema_id: int, record: dict, out: bytearray) -> int:
+        """Encode a record with a given schema id, appending the message to a buffer owned by the caller.
 
-            return outf.getvalue()
+        Useful to reuse a buffer between messages instead of allocating new bytes for each of them.
+
+        Args:
+            schema_id: integer ID
+            record: An object to serialize
+            out: Buffer where the encoded record with schema ID is appended
+
+        Returns:
+            Number of bytes written to the buffer
+        """
+        writer = self.id_to_writers.get(schema_id)
+        if writer is None:
+            # use slow avro
+            writer = self._fetch_writer(schema_id)
+
+        return self._pack_message_into(schema_id, writer, record, out)
+
+    def encode_records_with_schema_id(self, schema_id: int, records: typing.Iterable[dict]) -> typing.List[bytes]:
+        """Encode a batch of records with a given schema id. The records must be python dictionaries.
+
+        The writer and the message header are resolved once for the whole batch.
+
+        Args:
+            schema_id: integer ID
+            records: Objects to serialize
+
+        Returns:
+            Encoded records with schema ID, in the same order as the records
+        """
+        writer = self.id_to_writers.get(schema_id)
+        if writer is None:
+            # use slow avro
+            writer = self._fetch_writer(schema_id)
+
+        return self._pack_messages(schema_id, writer, records)
 
     def decode_message(self, message: typing.Optional[bytes]) -> typing.Optional[dict]:
         """Decode a message from kafka that has been encoded for use with the schema registry.
@@ -138,32 +459,54 @@ class MessageSerializer(ABC):
         if message is None:
             return None
 
-        if len(message) <= 5:
-            raise SerializerError("message is too small to decode")
+        schema_id, payload = self._unpack_message(message)
 
-        with ContextStringIO(message) as payload:
-            magic, schema_id = struct.unpack(">bI", payload.read(5))
-            if magic != MAGIC_BYTE:
-                raise SerializerError("message does not start with magic byte")
+        decoder_func = self.id_to_decoder_func.get(schema_id)
+        if decoder_func is None:
+            decoder_func = self._fetch_decoder(schema_id)
 
-            if schema_id in self.id_to_decoder_func:
-                return self.id_to_decoder_func[schema_id](payload)
+        return decoder_func(payload)
 
-            try:
-                writer_schema = self.schemaregistry_client.get_by_id(schema_id)
-            except ClientError as e:
-                raise SerializerError(f"unable to fetch schema with id {schema_id}: {e}") from e
+    def decode_messages(self, messages: typing.Iterable[typing.Optional[bytes]]) -> typing.List[typing.Optional[dict]]:
+        """Decode a batch of messages from kafka that have been encoded for use with the schema registry.
+
+        Args:
+            messages: message keys or values to be decoded
+
+        Returns:
+            Decoded messages contents, in the same order as the messages.
+        """
+        # bound once for the whole batch rather than looked up on every message
+        get_decoder_func = self.id_to_decoder_func.get
+        unpack_message = self._unpack_message
+        decoded: typing.List[typing.Optional[dict]] = []
+        append = decoded.append
+
+        for message in messages:
+            if message is None:
+                append(None)
+                continue
+
+            schema_id, payload = unpack_message(message)
+
+            decoder_func = get_decoder_func(schema_id)
+            if decoder_func is None:
+                decoder_func = self._fetch_decoder(schema_id)
 
-            if writer_schema is None:
-                raise SerializerError(f"unable to fetch schema with id {schema_id}")
+            append(decoder_func(payload))
 
-            decoder_func = self._get_decoder_func(payload, writer_schema)
-            self.id_to_decoder_func[schema_id] = decoder_func
+        return decoded
 
-            return decoder_func(payload)
+    def _fetch_decoder(self, schema_id: int) -> typing.Callable:
+        try:
+            writer_schema = self.schemaregistry_client.get_by_id(schema_id)
+        except ClientError as e:
+            raise SerializerError(f"unable to fetch schema with id {schema_id}: {e}") from e
 
+        return self._cache_decoder(schema_id, writer_schema)
 
-class AvroMessageSerializer(MessageSerializer):
+
+class AvroMessageSerializer(_AvroSerializerMixin, MessageSerializer):
     """AvroMessageSerializer to serialize and deserialize messages.
 
     !!! Example
@@ -223,25 +566,11 @@ class AvroMessageSerializer(MessageSerializer):
         schemaregistry_client: Http Client
         reader_schema: Specify a schema to decode the message
         return_record_name: If the record name should be returned
+        cache_size: Maximum number of schema writers and decoders kept in memory
     """
 
-    @property
-    def _serializer_schema_type(self) -> typing.Literal["AVRO", "JSON"]:
-        return utils.AVRO_SCHEMA_TYPE
-
-    def _get_encoder_func(self, schema: typing.Union[BaseSchema]) -> typing.Callable:
-        return lambda record, fp: schemaless_writer(fp, schema.schema, record)
-
-    def _get_decoder_func(self, payload: ContextStringIO, writer_schema: BaseSchema) -> typing.Callable:
-        return lambda payload: schemaless_reader(
-            payload,
-            writer_schema.schema,
-            typing.cast(Schema, self.reader_schema),
-            self.return_record_name,
-        )
 
-
-class JsonMessageSerializer(MessageSerializer):
+class JsonMessageSerializer(_JsonSerializerMixin, MessageSerializer):
     """JsonMessageSerializer to serialize and deserialize messages.
 
     !!! Example
@@ -301,58 +630,42 @@ class JsonMessageSerializer(MessageSerializer):
         schemaregistry_client: Http Client
         reader_schema: Specify a schema to decode the message
         return_record_name: If the record name should be returned
+        cache_size: Maximum number of schema writers and decoders kept in memory
+        use_orjson: Encode and decode the messages with orjson instead of the standard library json module
     """
 
-    @property
-    def _serializer_schema_type(self) -> typing.Literal["AVRO", "JSON"]:
-        return utils.JSON_SCHEMA_TYPE
-
-    def _get_encoder_func(self, schema: typing.Union[BaseSchema]) -> typing.Callable:
-        def json_encoder_func(record: dict, fp: ContextStringIO) -> typing.Any:
-            validate(record, schema.schema)
-            fp.write(json.dumps(record).encode())
-
-        return json_encoder_func
-
-    def _get_decoder_func(self, payload: ContextStringIO, writer_schema: BaseSchema) -> typing.Callable:
-        def json_decoder_func(payload: typing.IO) -> typing.Any:
-            obj = json.load(payload)
-            validate(obj, writer_schema.schema)
-            return obj
-
-        return json_decoder_func
+    def __init__(
+        self,
+        schemaregistry_client: SchemaRegistryClient,
+        reader_schema: typing.Optional[schema.AvroSchema] = None,
+        return_record_name: bool = False,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        use_orjson: bool = False,
+    ):
+        super().__init__(schemaregistry_client, reader_schema, return_record_name, cache_size)
+        self._set_use_orjson(use_orjson)
 
 
-class AsyncMessageSerializer(ABC):
+class AsyncMessageSerializer(_BaseMessageSerializer):
     """AsyncMessageSerializer to serialize and deserialize messages asynchronously.
 
     Args:
         schemaregistry_client: Http Client
         reader_schema: Specify a schema to decode the message
         return_record_name: If the record name should be returned
+        cache_size: Maximum number of schema writers and decoders kept in memory
     """
 
+    schemaregistry_client: AsyncSchemaRegistryClient
+
     def __init__(
         self,
         schemaregistry_client: AsyncSchemaRegistryClient,
         reader_schema: typing.Optional[schema.AvroSchema] = None,
         return_record_name: bool = False,
+        cache_size: int = DEFAULT_CACHE_SIZE,
     ):
-        self.schemaregistry_client = schemaregistry_client
-        self.id_to_decoder_func = {}  # type: typing.Dict
-        self.id_to_writers = {}  # type: typing.Dict
-        self.reader_schema = reader_schema
-        self.return_record_name = return_record_name
-
-    @property
-    @abstractmethod
-    def _serializer_schema_type(self) -> typing.Literal["AVRO", "JSON"]: ...
-
-    @abstractmethod
-    def _get_encoder_func(self, schema: BaseSchema) -> typing.Callable: ...
-
-    @abstractmethod
-    def _get_decoder_func(self, payload: ContextStringIO, writer_schema: BaseSchema) -> typing.Callable: ...
+        super().__init__(schemaregistry_client, reader_schema, return_record_name, cache_size)
 
     async def encode_record_with_schema(self, subject: str, schema: typing.Union[BaseSchema], record: dict) -> bytes:
         """Given a parsed avro schema, encode a record for the given subject.
@@ -372,10 +685,35 @@ class AsyncMessageSerializer(ABC):
         schema_id = await self.schemaregistry_client.register(subject, schema, schema_type=self._serializer_schema_type)
 
         # cache writer
-        if not self.id_to_writers.get(schema_id):
-            self.id_to_writers[schema_id] = self._get_encoder_func(schema)
+        writer = self._ensure_writer(schema_id, schema)
+
+        return self._pack_message(schema_id, writer, record)
+
+    async def register_schema(self, subject: str, schema: BaseSchema) -> int:
+        """Register a schema for the given subject, so records can be encoded with its schema ID.
+
+        The writer and the decoder of the schema are cached, messages encoded with it are decoded
+        without fetching the schema from the registry.
+
+        Args:
+            subject: Subject name
+            schema: Avro or JSON Schema
+
+        Returns:
+            Schema ID
+        """
+        schema_id = await self.schemaregistry_client.register(subject, schema, schema_type=self._serializer_schema_type)
+        self._cache_registered_schema(schema_id, schema)
+
+        return schema_id
 
-        return await self.encode_record_with_schema_id(schema_id, record)
+    async def _fetch_writer(self, schema_id: int) -> typing.Callable:
+        try:
+            schema = await self.schemaregistry_client.get_by_id(schema_id)
+        except ClientError as e:
+            raise SerializerError(f"unable to fetch schema with id {schema_id}: {e}") from e
+
+        return self._cache_writer(schema_id, schema)
 
     async def encode_record_with_schema_id(self, schema_id: int, record: dict) -> bytes:
         """Encode a record with a given schema id. The record must be a python dictionary.
@@ -387,27 +725,51 @@ class AsyncMessageSerializer(ABC):
         Returns:
             Decoder function
         """
-        # use slow avro
-        if schema_id not in self.id_to_writers:
-            try:
-                schema = await self.schemaregistry_client.get_by_id(schema_id)
+        writer = self.id_to_writers.get(schema_id)
+        if writer is None:
+            # use slow avro
+            writer = await self._fetch_writer(schema_id)
+
+        return self._pack_message(schema_id, writer, record)
+
+    async def encode_record_with_schema_id_into(self, schema_id: int, record: dict, out: bytearray) -> int:
+        """Encode a record with a given schema id, appending the message to a buffer owned by the caller.
+
+        Useful to reuse a buffer between messages instead of allocating new bytes for each of them.
+
+        Args:
+            schema_id: integer ID
+            record: An object to serialize
+            out: Buffer where the encoded record with schema ID is appended
 
-                if not schema:
-                    raise SerializerError("Schema does not exist")
-                self.id_to_writers[schema_id] = self._get_encoder_func(schema)
-            except ClientError as err:
-                exc_type, exc_value, exc_traceback = sys.exc_info()
-                raise SerializerError(repr(traceback.format_exception(exc_type, exc_value, exc_traceback))) from err
+        Returns:
+            Number of bytes written to the buffer
+        """
+        writer = self.id_to_writers.get(schema_id)
+        if writer is None:
+            # use slow avro
+            writer = await self._fetch_writer(schema_id)
 
-        writer = self.id_to_writers[schema_id]
-        with ContextStringIO() as outf:
-            # Write the magic byte and schema ID in network byte order (big endian)
-            outf.write(struct.pack(">bI", MAGIC_BYTE, schema_id))
+        return self._pack_message_into(schema_id, writer, record, out)
 
-            # write the record to the rest of the buffer
-            writer(record, outf)
+    async def encode_records_with_schema_id(self, schema_id: int, records: typing.Iterable[dict]) -> typing.List[bytes]:
+        """Encode a batch of records with a given schema id. The records must be python dictionaries.
 
-            return outf.getvalue()
+        The writer and the message header are resolved once for the whole batch.
+
+        Args:
+            schema_id: integer ID
+            records: Objects to serialize
+
+        Returns:
+            Encoded records with schema ID, in the same order as the records
+        """
+        writer = self.id_to_writers.get(schema_id)
+        if writer is None:
+            # use slow avro
+            writer = await self._fetch_writer(schema_id)
+
+        return self._pack_messages(schema_id, writer, records)
 
     async def decode_message(self, message: typing.Optional[bytes]) -> typing.Optional[dict]:
         """Decode a message from kafka that has been encoded for use with the schema registry.
@@ -421,80 +783,83 @@ class AsyncMessageSerializer(ABC):
         if message is None:
             return None
 
-        if len(message) <= 5:
-            raise SerializerError("message is too small to decode")
+        schema_id, payload = self._unpack_message(message)
 
-        with ContextStringIO(message) as payload:
-            magic, schema_id = struct.unpack(">bI", payload.read(5))
-            if magic != MAGIC_BYTE:
-                raise SerializerError("message does not start with magic byte")
+        decoder_func = self.id_to_decoder_func.get(schema_id)
+        if decoder_func is None:
+            decoder_func = await self._fetch_decoder(schema_id)
 
-            if schema_id in self.id_to_decoder_func:
-                return self.id_to_decoder_func[schema_id](payload)
+        return decoder_func(payload)
 
-            try:
-                writer_schema = await self.schemaregistry_client.get_by_id(schema_id)
-            except ClientError as e:
-                raise SerializerError(f"unable to fetch schema with id {schema_id}: {e}") from e
+    async def decode_messages(
+        self, messages: typing.Iterable[typing.Optional[bytes]]
+    ) -> typing.List[typing.Optional[dict]]:
+        """Decode a batch of messages from kafka that have been encoded for use with the schema registry.
 
-            if writer_schema is None:
-                raise SerializerError(f"unable to fetch schema with id {schema_id}")
+        Args:
+            messages: message keys or values to be decoded
 
-            decoder_func = self._get_decoder_func(payload, writer_schema)
-            self.id_to_decoder_func[schema_id] = decoder_func
+        Returns:
+            Decoded messages contents, in the same order as the messages.
+        """
+        unpack_message = self._unpack_message
+        unpacked = [None if message is None else unpack_message(message) for message in messages]
+
+        # resolve every decoder of the batch upfront, fetching the unknown schemas concurrently
+        decoders: typing.Dict[int, typing.Callable] = {}
+        missing_schema_ids = []
+        get_decoder_func = self.id_to_decoder_func.get
+        for schema_id in {item[0] for item in unpacked if item is not None}:
+            decoder_func = get_decoder_func(schema_id)
+            if decoder_func is None:
+                missing_schema_ids.append(schema_id)
+            else:
+                decoders[schema_id] = decoder_func
+
+        if missing_schema_ids:
+            fetched = await asyncio.gather(*(self._fetch_decoder(schema_id) for schema_id in missing_schema_ids))
+            decoders.update(zip(missing_schema_ids, fetched))
 
-            return decoder_func(payload)
+        return [None if item is None else decoders[item[0]](item[1]) for item in unpacked]
 
+    async def _fetch_decoder(self, schema_id: int) -> typing.Callable:
+        try:
+            writer_schema = await self.schemaregistry_client.get_by_id(schema_id)
+        except ClientError as e:
+            raise SerializerError(f"unable to fetch schema with id {schema_id}: {e}") from e
 
-class AsyncAvroMessageSerializer(AsyncMessageSerializer):
+        return self._cache_decoder(schema_id, writer_schema)
+
+
+class AsyncAvroMessageSerializer(_AvroSerializerMixin, AsyncMessageSerializer):
     """AsyncAvroMessageSerializer to serialize and deserialize messages asynchronously.
 
     Args:
         schemaregistry_client: Http Client
         reader_schema: Specify a schema to decode the message
         return_record_name: If the record name should be returned
+        cache_size: Maximum number of schema writers and decoders kept in memory
     """
 
-    @property
-    def _serializer_schema_type(self) -> typing.Literal["AVRO", "JSON"]:
-        return utils.AVRO_SCHEMA_TYPE
 
-    def _get_encoder_func(self, schema: typing.Union[BaseSchema]) -> typing.Callable:
-        return lambda record, fp: schemaless_writer(fp, schema.schema, record)
-
-    def _get_decoder_func(self, payload: ContextStringIO, writer_schema: BaseSchema) -> typing.Callable:
-        return lambda payload: schemaless_reader(
-            payload,
-            writer_schema.schema,
-            typing.cast(Schema, self.reader_schema),
-            self.return_record_name,
-        )
-
-
-class AsyncJsonMessageSerializer(AsyncMessageSerializer):
+class AsyncJsonMessageSerializer(_JsonSerializerMixin, AsyncMessageSerializer):
     """AsyncJsonMessageSerializer to serialize and deserialize messages asynchronously.
 
     Args:
         schemaregistry_client: Http Client
         reader_schema: Specify a schema to decode the message
         return_record_name: If the record name should be returned
+        cache_size: Maximum number of schema writers and decoders kept in memory
+        use_orjson: Encode and decode the messages with orjson instead of the standard library json module
     """
 
-    @property
-    def _serializer_schema_type(self) -> typing.Literal["AVRO", "JSON"]:
-        return utils.JSON_SCHEMA_TYPE
-
-    def _get_encoder_func(self, schema: typing.Union[BaseSchema]) -> typing.Callable:
-        def json_encoder_func(record: dict, fp: ContextStringIO) -> typing.Any:
-            validate(record, schema.schema)
-            fp.write(json.dumps(record).encode())
-
-        return json_encoder_func
-
-    def _get_decoder_func(self, payload: ContextStringIO, writer_schema: BaseSchema) -> typing.Callable:
-        def json_decoder_func(payload: typing.IO) -> typing.Any:
-            obj = json.load(payload)
-            validate(obj, writer_schema.schema)
-            return obj
-
-        return json_decoder_func
+    def __init__(
+        self,
+        schemaregistry_client: AsyncSchemaRegistryClient,
+        reader_schema: typing.Optional[schema.AvroSchema] = None,
+        return_record_name: bool = False,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        use_orjson: bool = False,
+    ):
+        super().__init__(schemaregistry_client, reader_schema, return_record_name, cache_size)
+        self._set_use_orjson(use_orjson)
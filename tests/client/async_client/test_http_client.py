@@ -1,4 +1,5 @@
 # import pickle
+import asyncio
 import os
 from base64 import b64encode
 
@@ -27,6 +28,47 @@ def test_cert_with_key(certificates):
     assert client.conf[utils.SSL_KEY_PASSWORD] == certificates["password"]
 
 
+@pytest.mark.asyncio
+async def test_session_is_reused(async_client):
+    session = async_client.session
+    await async_client.get_subjects()
+    await async_client.get_subjects()
+    assert async_client.session is session
+
+    await async_client.aclose()
+    assert async_client._session is None
+
+    async with AsyncSchemaRegistryClient(url=os.getenv("SCHEMA_REGISTRY_URL")) as other_client:
+        await other_client.get_subjects()
+    assert other_client._session is None
+
+
+def test_session_in_several_event_loops():
+    client = AsyncSchemaRegistryClient(url=os.getenv("SCHEMA_REGISTRY_URL"))
+
+    async def get_subjects():
+        subjects = await client.get_subjects()
+        return subjects, client.session
+
+    def run(coro):
+        # like `asyncio.run`, without replacing the event loop set by pytest-asyncio
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    subjects, session = run(get_subjects())
+    # the session is closed with its loop, the next loop gets its own one
+    assert session.is_closed
+    other_subjects, other_session = run(get_subjects())
+
+    assert other_subjects == subjects
+    assert other_session is not session
+    assert other_session.is_closed
+
+
 def test_custom_headers():
     extra_headers = {"custom-serialization": utils.HEADER_AVRO_JSON}
 
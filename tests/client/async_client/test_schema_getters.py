@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from schema_registry.client import schema as schema_loader
@@ -23,6 +25,38 @@ async def test_avro_getters(async_client):
     assert fetched == parsed_basic
 
 
+@pytest.mark.asyncio
+async def test_concurrent_get_by_id_single_request(async_client):
+    parsed_basic = schema_loader.AvroSchema(data_gen.AVRO_BASIC_SCHEMA)
+    schema_id = await async_client.register("test-avro-basic-schema", parsed_basic)
+    async_client.id_to_schema.clear()
+    request_calls = len(async_client.request_calls)
+
+    schemas = await asyncio.gather(*(async_client.get_by_id(schema_id) for _ in range(5)))
+
+    assert schemas == [parsed_basic] * 5
+    assert len(async_client.request_calls) == request_calls + 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_by_id_with_headers(async_client):
+    parsed_basic = schema_loader.AvroSchema(data_gen.AVRO_BASIC_SCHEMA)
+    schema_id = await async_client.register("test-avro-basic-schema", parsed_basic)
+    async_client.id_to_schema.clear()
+    request_calls = len(async_client.request_calls)
+    headers = {"custom-serialization": "application/x-avro-json"}
+
+    schemas = await asyncio.gather(
+        async_client.get_by_id(schema_id),
+        async_client.get_by_id(schema_id, headers=headers),
+    )
+
+    assert schemas == [parsed_basic] * 2
+    # a call with its own headers does not share the pending request
+    assert len(async_client.request_calls) == request_calls + 2
+    assert [call.headers for call in async_client.request_calls[request_calls:]].count(headers) == 1
+
+
 @pytest.mark.asyncio
 async def test_avro_get_subjects(async_client, avro_user_schema_v3, avro_country_schema):
     subject_user = "test-avro-user-schema"
@@ -40,6 +40,21 @@ def test_pickelable(client):
 
     assert schema_id > 0
     assert unpickled_client.delete_subject(subject)
+    unpickled_client.close()
+
+
+def test_session_is_reused(client):
+    session = client.session
+    client.get_subjects()
+    client.get_subjects()
+    assert client.session is session
+
+    client.close()
+    assert client._session is None
+
+    with SchemaRegistryClient(url=client.conf[utils.URL]) as other_client:
+        other_client.get_subjects()
+    assert other_client._session is None
 
 
 def test_custom_headers():
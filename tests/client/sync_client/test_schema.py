@@ -1,3 +1,5 @@
+import json
+
 import fastavro
 import jsonschema
 import pytest
@@ -110,3 +112,38 @@ def test_json_schema_load_parse_error():
 def test_json_schema_type_property():
     parsed = schema.JsonSchema(data_gen.JSON_BASIC_SCHEMA)
     assert parsed.schema_type == "JSON"
+
+
+def test_json_schema_validator():
+    parsed = schema.JsonSchema(data_gen.JSON_BASIC_SCHEMA)
+
+    assert parsed.validator is parsed.validator
+    assert parsed.validator.is_valid(data_gen.create_basic_item(1))
+    assert not parsed.validator.is_valid({"number": "not a number"})
+
+
+def test_raw_schema_str():
+    parsed = schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA)
+
+    assert json.loads(parsed.raw_schema_str) == parsed.raw_schema
+    assert parsed.raw_schema_str is parsed.raw_schema_str
+
+
+def test_avro_schema_not_shared_between_instances():
+    avro_schema = schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA)
+    other_avro_schema = schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA)
+    assert other_avro_schema.schema is not avro_schema.schema
+
+    # changing the parsed schema of an instance does not leak into equal ones
+    avro_schema.schema["fields"].append({"name": "extra", "type": "string"})
+    assert len(other_avro_schema.schema["fields"]) == len(json.loads(data_gen.AVRO_BASIC_SCHEMA)["fields"])
+    assert schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA).schema == other_avro_schema.schema
+
+
+def test_json_schema_keeps_big_integers():
+    # integers over 64 bits are kept as they are
+    maximum = 2**64 + 1
+    json_schema = schema.JsonSchema(json.dumps({"type": "integer", "maximum": maximum}))
+
+    assert json_schema.raw_schema["maximum"] == maximum
+    assert isinstance(json_schema.raw_schema["maximum"], int)
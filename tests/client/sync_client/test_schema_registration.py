@@ -93,6 +93,17 @@ def test_avro_dupe_register(client):
     assert latest == dupe_latest
 
 
+def test_avro_register_equal_schema_instances(client):
+    subject = "test-avro-basic-schema"
+    schema_id = client.register(subject, schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA))
+    assert len(client.request_calls) == 2
+
+    # a new instance of the same schema is served from cache
+    dupe_id = client.register(subject, schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA))
+    assert schema_id == dupe_id
+    assert len(client.request_calls) == 2
+
+
 def test_avro_multi_register(client):
     """Register two different schemas under the same subject with backwards compatibility."""
     version_1 = schema.AvroSchema(data_gen.AVRO_USER_V1)
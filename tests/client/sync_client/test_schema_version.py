@@ -4,6 +4,10 @@ from schema_registry.client import utils
 def test_avro_version_does_not_exists(client, avro_country_schema):
     assert client.check_version("test-avro-schema-version", avro_country_schema) is None
 
+    # a miss does not leave an empty entry behind in the caches
+    assert "test-avro-schema-version" not in client.subject_to_schema_ids
+    assert "test-avro-schema-version" not in client.subject_to_schema_versions
+
 
 def test_avro_get_versions(client, avro_country_schema):
     subject = "test-avro-schema-version"
@@ -53,3 +53,11 @@ def test_client_paths(base_url):
         url, method = url_manager.url_for(func, **kwargs)
 
         assert base_url in url
+
+
+@pytest.mark.parametrize("base_url", BASE_URLS)
+def test_urls_generation_keeps_subject_as_is(base_url):
+    url_manager = urls.UrlManager(base_url, paths)
+
+    url, _ = url_manager.url_for("get_versions", subject="my:subject")
+    assert url == f"{base_url.rstrip('/')}/subjects/my:subject/versions"
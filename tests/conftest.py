@@ -206,6 +206,8 @@ def client():
         except errors.ClientError as exc:
             logger.info(exc.message)
 
+    client.close()
+
 
 @pytest.fixture
 def schemas():
@@ -370,6 +372,8 @@ async def async_client():
         except errors.ClientError as exc:
             logger.info(exc.message)
 
+    await client.aclose()
+
 
 @pytest.fixture
 def dataclass_avro_schema():
@@ -1,3 +1,4 @@
+import asyncio
 import math
 import struct
 
@@ -5,6 +6,7 @@ import jsonschema
 import pytest
 
 from schema_registry.client import schema
+from schema_registry.serializers import AsyncAvroMessageSerializer
 from tests import data_gen
 
 pytestmark = pytest.mark.asyncio
@@ -45,6 +47,52 @@ async def test_avro_encode_with_schema_id(async_client, async_avro_message_seria
         await assertAvroMessageIsSame(message, record, adv_schema_id, async_avro_message_serializer)
 
 
+async def test_avro_encode_with_schema_id_into(async_client, async_avro_message_serializer):
+    basic = schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA)
+    schema_id = await async_client.register("test-avro-basic-schema", basic)
+    record = data_gen.create_basic_item(1)
+
+    buffer = bytearray(b"previous")
+    size = await async_avro_message_serializer.encode_record_with_schema_id_into(schema_id, record, buffer)
+
+    assert buffer[: len(b"previous")] == b"previous"
+    message = bytes(buffer[len(b"previous") :])
+    assert len(message) == size
+    await assertAvroMessageIsSame(message, record, schema_id, async_avro_message_serializer)
+
+
+async def test_avro_encode_decode_batch(async_client, async_avro_message_serializer):
+    basic = schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA)
+    schema_id = await async_client.register("test-avro-basic-schema", basic)
+    records = [data_gen.create_basic_item(i) for i in range(3)]
+
+    messages = await async_avro_message_serializer.encode_records_with_schema_id(schema_id, records)
+    for record, message in zip(records, messages):
+        await assertAvroMessageIsSame(message, record, schema_id, async_avro_message_serializer)
+
+    assert await async_avro_message_serializer.decode_messages([*messages, None]) == [*records, None]
+
+
+async def test_avro_decode_batch_with_unknown_schemas(async_client, async_avro_message_serializer):
+    basic_schema_id = await async_client.register(
+        "test-avro-basic-schema", schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA)
+    )
+    adv_schema_id = await async_client.register(
+        "test-avro-advance-schema", schema.AvroSchema(data_gen.AVRO_ADVANCED_SCHEMA)
+    )
+    basic_record = data_gen.create_basic_item(1)
+    adv_record = data_gen.create_adv_item(1)
+    basic_message = await async_avro_message_serializer.encode_record_with_schema_id(basic_schema_id, basic_record)
+    adv_message = await async_avro_message_serializer.encode_record_with_schema_id(adv_schema_id, adv_record)
+
+    # a new serializer does not know any of the schemas yet
+    serializer = AsyncAvroMessageSerializer(async_client)
+    decoded = await serializer.decode_messages([adv_message, None, basic_message, adv_message])
+
+    assert decoded == [adv_record, None, basic_record, adv_record]
+    assert set(serializer.id_to_decoder_func) == {basic_schema_id, adv_schema_id}
+
+
 async def test_avro_encode_logical_types(async_client, async_avro_message_serializer):
     logical_types_schema = schema.AvroSchema(data_gen.AVRO_LOGICAL_TYPES_SCHEMA)
     subject = "test-logical-types-schema"
@@ -136,6 +184,50 @@ async def test_avro_encode_record_with_schema(async_client, async_avro_message_s
         await assertAvroMessageIsSame(message, record, schema_id, async_avro_message_serializer)
 
 
+async def test_avro_decode_with_reader_schema(async_client):
+    writer_schema = schema.AvroSchema(data_gen.AVRO_USER_V1)
+    reader_schema = schema.AvroSchema(data_gen.AVRO_USER_V2)
+    async_avro_message_serializer = AsyncAvroMessageSerializer(async_client, reader_schema=reader_schema)
+
+    message = await async_avro_message_serializer.encode_record_with_schema(
+        "test-avro-user-schema", writer_schema, {"name": "john"}
+    )
+
+    decoded = await async_avro_message_serializer.decode_message(message)
+    assert decoded == {"name": "john", "favorite_number": 42, "favorite_color": "purple"}
+
+
+async def test_avro_register_schema(async_client, async_avro_message_serializer):
+    basic = schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA)
+    schema_id = await async_avro_message_serializer.register_schema("test-avro-basic-schema", basic)
+    assert schema_id == await async_client.register("test-avro-basic-schema", basic)
+
+    record = data_gen.create_basic_item(1)
+    message = await async_avro_message_serializer.encode_record_with_schema_id(schema_id, record)
+
+    async_client.id_to_schema.clear()
+    request_calls = len(async_client.request_calls)
+    assert await async_avro_message_serializer.decode_message(message) == record
+    # writer and decoder were cached when the schema was registered
+    assert len(async_client.request_calls) == request_calls
+
+
+async def test_avro_concurrent_decode_fetches_schema_once(async_client, async_avro_message_serializer):
+    basic = schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA)
+    schema_id = await async_client.register("test-avro-basic-schema", basic)
+    records = [data_gen.create_basic_item(i) for i in range(5)]
+    messages = await async_avro_message_serializer.encode_records_with_schema_id(schema_id, records)
+
+    # force the schema to be requested to the registry
+    async_client.id_to_schema.clear()
+    request_calls = len(async_client.request_calls)
+    serializer = AsyncAvroMessageSerializer(async_client)
+    decoded = await asyncio.gather(*(serializer.decode_message(message) for message in messages))
+
+    assert decoded == records
+    assert len(async_client.request_calls) == request_calls + 1
+
+
 async def test_avro_decode_none(async_avro_message_serializer):
     """ "null/None messages should decode to None"""
     assert await async_avro_message_serializer.decode_message(None) is None
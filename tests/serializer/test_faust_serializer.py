@@ -34,6 +34,56 @@ def test_avro_dumps_load_message(client, avro_country_schema):
     assert message_decoded == record
 
 
+def test_avro_loads_message_with_own_schema_skips_registry(client, avro_country_schema):
+    faust_serializer = serializer.FaustSerializer(client, "test-avro-country", avro_country_schema)
+
+    record = {"country": "Argentina"}
+    message_encoded = faust_serializer._dumps(record)
+
+    # the writer schema is not fetched, even if the client forgot it
+    client.id_to_schema.clear()
+    request_calls = len(client.request_calls)
+    assert faust_serializer._loads(message_encoded) == record
+    assert len(client.request_calls) == request_calls
+
+
+def test_avro_dumps_registers_schema_once(client, avro_country_schema, mocker):
+    faust_serializer = serializer.FaustSerializer(client, "test-avro-country", avro_country_schema)
+    register = mocker.spy(client, "register")
+
+    messages = [faust_serializer._dumps({"country": country}) for country in ("Argentina", "Uruguay", "Chile")]
+
+    assert register.call_count == 1
+    assert [faust_serializer._loads(message) for message in messages] == [
+        {"country": "Argentina"},
+        {"country": "Uruguay"},
+        {"country": "Chile"},
+    ]
+
+
+def test_avro_dumps_loads_many(client, avro_country_schema):
+    faust_serializer = serializer.FaustSerializer(client, "test-avro-country", avro_country_schema)
+    records = [{"country": country} for country in ("Argentina", "Uruguay", "Chile")]
+
+    messages = faust_serializer.dumps_many(records)
+
+    assert messages == [faust_serializer.dumps(record) for record in records]
+    assert faust_serializer.loads_many(messages + [None]) == records + [None]
+
+
+def test_avro_dumps_loads_many_chained_codec(client, avro_country_schema):
+    faust_serializer = serializer.FaustSerializer(client, "test-avro-country", avro_country_schema)
+    chained_serializer = faust_serializer | faust.serializers.codecs.get_codec("binary")
+    records = [{"country": country} for country in ("Argentina", "Uruguay", "Chile")]
+
+    messages = chained_serializer.dumps_many(records)
+
+    assert isinstance(chained_serializer, serializer.Serializer)
+    assert messages == [chained_serializer.dumps(record) for record in records]
+    assert chained_serializer.loads(messages[0]) == records[0]
+    assert chained_serializer.loads_many(messages + [None]) == records + [None]
+
+
 def test_avro_nested_schema(client):
     nested_schema = schema.AvroSchema(data_gen.AVRO_NESTED_SCHEMA)
     faust_serializer = serializer.FaustSerializer(client, "test-avro-nested-schema", nested_schema)
@@ -1,10 +1,15 @@
+import copy
+import json
 import math
+import pickle
 import struct
+import weakref
 
 import jsonschema
 import pytest
 
 from schema_registry.client import schema
+from schema_registry.serializers import AvroMessageSerializer, JsonMessageSerializer
 from tests import data_gen
 
 
@@ -43,6 +48,57 @@ def test_avro_encode_with_schema_id(client, avro_message_serializer):
         assertAvroMessageIsSame(message, record, adv_schema_id, avro_message_serializer)
 
 
+def test_avro_encode_with_schema_id_into(client, avro_message_serializer):
+    basic = schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA)
+    schema_id = client.register("test-avro-basic-schema", basic)
+    records = [data_gen.create_basic_item(i) for i in range(3)]
+
+    buffer = bytearray()
+    sizes = [avro_message_serializer.encode_record_with_schema_id_into(schema_id, record, buffer) for record in records]
+    assert sum(sizes) == len(buffer)
+
+    offset = 0
+    for record, size in zip(records, sizes):
+        message = bytes(buffer[offset : offset + size])
+        assert message == avro_message_serializer.encode_record_with_schema_id(schema_id, record)
+        assertAvroMessageIsSame(message, record, schema_id, avro_message_serializer)
+        offset += size
+
+
+def test_avro_encode_with_schema_id_into_bad_record(client, avro_message_serializer):
+    schema_id = client.register("test-avro-basic-schema", schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA))
+    buffer = bytearray()
+    avro_message_serializer.encode_record_with_schema_id_into(schema_id, data_gen.create_basic_item(1), buffer)
+    content = bytes(buffer)
+
+    with pytest.raises((TypeError, ValueError)):
+        avro_message_serializer.encode_record_with_schema_id_into(schema_id, {"name": 1, "number": "1"}, buffer)
+
+    assert buffer == content
+
+
+def test_avro_encode_decode_batch(client, avro_message_serializer):
+    basic_schema_id = client.register("test-avro-basic-schema", schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA))
+    adv_schema_id = client.register("test-avro-advance-schema", schema.AvroSchema(data_gen.AVRO_ADVANCED_SCHEMA))
+    basic_records = [data_gen.create_basic_item(i) for i in range(3)]
+    adv_records = [data_gen.create_adv_item(i) for i in range(3)]
+
+    basic_messages = avro_message_serializer.encode_records_with_schema_id(basic_schema_id, basic_records)
+    adv_messages = avro_message_serializer.encode_records_with_schema_id(adv_schema_id, adv_records)
+    assert basic_messages == [
+        avro_message_serializer.encode_record_with_schema_id(basic_schema_id, record) for record in basic_records
+    ]
+
+    messages = [basic_messages[0], adv_messages[0], None, basic_messages[1], adv_messages[1]]
+    assert avro_message_serializer.decode_messages(messages) == [
+        basic_records[0],
+        adv_records[0],
+        None,
+        basic_records[1],
+        adv_records[1],
+    ]
+
+
 def test_avro_encode_logical_types(client, avro_message_serializer):
     logical_types_schema = schema.AvroSchema(data_gen.AVRO_LOGICAL_TYPES_SCHEMA)
     subject = "test-logical-types-schema"
@@ -132,6 +188,102 @@ def test_avro_encode_record_with_schema(client, avro_message_serializer):
         assertAvroMessageIsSame(message, record, schema_id, avro_message_serializer)
 
 
+def test_avro_decode_with_reader_schema(client):
+    writer_schema = schema.AvroSchema(data_gen.AVRO_USER_V1)
+    reader_schema = schema.AvroSchema(data_gen.AVRO_USER_V2)
+    avro_message_serializer = AvroMessageSerializer(client, reader_schema=reader_schema)
+
+    message = avro_message_serializer.encode_record_with_schema(
+        "test-avro-user-schema", writer_schema, {"name": "john"}
+    )
+
+    decoded = avro_message_serializer.decode_message(message)
+    assert decoded == {"name": "john", "favorite_number": 42, "favorite_color": "purple"}
+
+
+def test_avro_serializer_cache_size(client):
+    avro_message_serializer = AvroMessageSerializer(client, cache_size=1)
+    basic_schema_id = client.register("test-avro-basic-schema", schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA))
+    adv_schema_id = client.register("test-avro-advance-schema", schema.AvroSchema(data_gen.AVRO_ADVANCED_SCHEMA))
+    basic_record = data_gen.create_basic_item(1)
+    adv_record = data_gen.create_adv_item(1)
+
+    basic_message = avro_message_serializer.encode_record_with_schema_id(basic_schema_id, basic_record)
+    adv_message = avro_message_serializer.encode_record_with_schema_id(adv_schema_id, adv_record)
+    assert list(avro_message_serializer.id_to_writers) == [adv_schema_id]
+
+    assert avro_message_serializer.decode_message(basic_message) == basic_record
+    assert avro_message_serializer.decode_message(adv_message) == adv_record
+    assert list(avro_message_serializer.id_to_decoder_func) == [adv_schema_id]
+
+
+def test_avro_serializer_is_a_regular_object(avro_message_serializer, mocker):
+    assert weakref.ref(avro_message_serializer)() is avro_message_serializer
+
+    avro_message_serializer.topic = "test"
+    decode_message = mocker.spy(avro_message_serializer, "decode_message")
+    assert avro_message_serializer.decode_message(None) is None
+    decode_message.assert_called_once_with(None)
+
+
+def test_avro_serializer_subclass_decoder_func(client):
+    class UpperNameSerializer(AvroMessageSerializer):
+        def _get_decoder_func(self, payload, writer_schema):
+            decoder_func = super()._get_decoder_func(payload, writer_schema)
+
+            def upper_name_decoder_func(payload):
+                record = decoder_func(payload)
+                return {**record, "name": record["name"].upper()}
+
+            return upper_name_decoder_func
+
+    serializer = UpperNameSerializer(client)
+    schema_id = client.register("test-avro-basic-schema", schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA))
+    record = data_gen.create_basic_item(1)
+    message = serializer.encode_record_with_schema_id(schema_id, record)
+
+    assert serializer.decode_message(message) == {**record, "name": record["name"].upper()}
+
+
+def test_avro_serializer_copy_and_pickle(client):
+    avro_message_serializer = AvroMessageSerializer(client, cache_size=2)
+    unpickled = pickle.loads(pickle.dumps(avro_message_serializer))
+    assert unpickled.id_to_writers.maxsize == 2
+
+    schema_id = client.register("test-avro-basic-schema", schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA))
+    avro_message_serializer.encode_record_with_schema_id(schema_id, data_gen.create_basic_item(1))
+
+    for cache in (avro_message_serializer.id_to_writers.copy(), copy.deepcopy(avro_message_serializer).id_to_writers):
+        assert cache.maxsize == 2
+        assert list(cache) == [schema_id]
+
+
+def test_avro_register_schema(client, avro_message_serializer):
+    basic = schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA)
+    schema_id = avro_message_serializer.register_schema("test-avro-basic-schema", basic)
+    assert schema_id == client.register("test-avro-basic-schema", basic)
+
+    record = data_gen.create_basic_item(1)
+    message = avro_message_serializer.encode_record_with_schema_id(schema_id, record)
+
+    client.id_to_schema.clear()
+    request_calls = len(client.request_calls)
+    assert avro_message_serializer.decode_message(message) == record
+    # writer and decoder were cached when the schema was registered
+    assert len(client.request_calls) == request_calls
+
+
+def test_avro_encode_record_with_schema_builds_writer_once(avro_message_serializer, mocker):
+    spy = mocker.spy(AvroMessageSerializer, "_get_encoder_func")
+    basic = schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA)
+    subject = "test-avro-basic-schema"
+
+    for i in range(3):
+        avro_message_serializer.encode_record_with_schema(subject, basic, data_gen.create_basic_item(i))
+
+    assert spy.call_count == 1
+
+
 def test_avro_decode_none(avro_message_serializer):
     """ "null/None messages should decode to None"""
     assert avro_message_serializer.decode_message(None) is None
@@ -203,6 +355,17 @@ def test_json_fail_encode_with_schema(json_message_serializer, json_deployment_s
         json_message_serializer.encode_record_with_schema("json-deployment", json_deployment_schema, bad_record)
 
 
+def test_json_with_avro_schema_id(client, avro_message_serializer, json_message_serializer):
+    schema_id = client.register("test-avro-basic-schema", schema.AvroSchema(data_gen.AVRO_BASIC_SCHEMA))
+    message = avro_message_serializer.encode_record_with_schema_id(schema_id, data_gen.create_basic_item(1))
+
+    with pytest.raises(jsonschema.exceptions.SchemaError):
+        json_message_serializer.decode_message(message)
+
+    with pytest.raises(jsonschema.exceptions.SchemaError):
+        json_message_serializer.encode_record_with_schema_id(schema_id, data_gen.create_basic_item(1))
+
+
 def test_json_encode_record_with_schema(client, json_message_serializer):
     topic = "test"
     basic = schema.JsonSchema(data_gen.JSON_BASIC_SCHEMA)
@@ -218,3 +381,29 @@ def test_json_encode_record_with_schema(client, json_message_serializer):
 def test_json_decode_none(json_message_serializer):
     """null/None messages should decode to None."""
     assert json_message_serializer.decode_message(None) is None
+
+
+def test_json_encode_with_standard_json_by_default(client, json_message_serializer):
+    schema_id = client.register("test-json-basic-schema", schema.JsonSchema(data_gen.JSON_BASIC_SCHEMA))
+    record = {"name": "a_name", "number": 2**70}
+
+    message = json_message_serializer.encode_record_with_schema_id(schema_id, record)
+
+    assert message[5:] == json.dumps(record).encode()
+    assert json_message_serializer.decode_message(message) == record
+
+
+def test_json_encode_decode_with_orjson(client):
+    orjson = pytest.importorskip("orjson")
+    json_message_serializer = JsonMessageSerializer(client, use_orjson=True)
+    schema_id = client.register("test-json-basic-schema", schema.JsonSchema(data_gen.JSON_BASIC_SCHEMA))
+    record = {"name": "a_name", "number": 10}
+
+    message = json_message_serializer.encode_record_with_schema_id(schema_id, record)
+    assert message[5:] == orjson.dumps(record)
+    assert json_message_serializer.decode_message(message) == record
+
+    # records orjson can not encode are encoded with the standard library
+    record = {"name": "a_name", "number": 2**70}
+    message = json_message_serializer.encode_record_with_schema_id(schema_id, record)
+    assert message[5:] == json.dumps(record).encode()